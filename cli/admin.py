@@ -1,7 +1,17 @@
 """Interactive admin panel for managing Tendrils Server users and tokens."""
 
+import hashlib
+import re
 import sys
-
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    import httpxr as httpx  # must match the library cli.client uses
+except ImportError:
+    import httpx
+import orjson
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
@@ -9,6 +19,13 @@ from rich.table import Table
 from cli.client import AdminClient, TendrilsAPIError
 
 console = Console()
+# Errors go to stderr so script-mode stdout stays valid NDJSON
+err_console = Console(stderr=True)
+
+# A fresh marker file here means (server, secret) validated recently, so
+# startup can skip the ping + list_users round trip. Holds no secret.
+_SESSION_DIR = Path.home() / ".cache" / "tendrils" / "admin_session"
+_SESSION_TTL = 600  # seconds
 
 
 MENU = """
@@ -23,8 +40,13 @@ MENU = """
 """
 
 
+_MENU_PANEL = Panel(MENU.strip(), title="[bold]TENDRILS ADMIN PANEL[/bold]", border_style="cyan")
+
+_PAUSE_PROMPT = "\n  Press Enter to continue..."
+
+
 def _print_menu():
-    console.print(Panel(MENU.strip(), title="[bold]TENDRILS ADMIN PANEL[/bold]", border_style="cyan"))
+    console.print(_MENU_PANEL)
 
 
 def _input(prompt: str) -> str:
@@ -38,11 +60,40 @@ def _input(prompt: str) -> str:
 def _pause():
     """Wait for user to press Enter before returning to menu."""
     try:
-        input("\n  Press Enter to continue...")
+        input(_PAUSE_PROMPT)
     except EOFError:
         pass
 
 
+def _session_path(server_url: str, admin_secret: str) -> Path:
+    digest = hashlib.sha256(f"{server_url}\0{admin_secret}".encode()).hexdigest()
+    return _SESSION_DIR / digest
+
+
+def _session_is_fresh(path: Path) -> bool:
+    try:
+        return time.time() - path.stat().st_mtime < _SESSION_TTL
+    except OSError:
+        return False
+
+
+def _remember_session(path: Path):
+    try:
+        # Owner-only: the marker names are hashes of the secret
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        path.parent.chmod(0o700)
+        path.touch()
+    except OSError:
+        pass
+
+
+def _forget_session(path: Path):
+    try:
+        path.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
 # ── Menu Actions ────────────────────────────────────────────────────────────
 
 
@@ -142,38 +193,146 @@ def _action_change_secret(client: AdminClient):
     console.print(f"\n  [green]{result['message']}[/green]")
 
 
-# ── Main Loop ───────────────────────────────────────────────────────────────
+# ── Script Mode ─────────────────────────────────────────────────────────────
 
-ACTIONS = {
-    "1": ("List users", _action_list_users),
-    "2": ("Get user token", _action_get_token),
-    "3": ("Register new user", _action_register),
-    "4": ("Update user name", _action_update),
-    "5": ("Rotate user token", _action_rotate),
-    "6": ("Delete user", _action_delete),
-    "7": ("Change admin secret", _action_change_secret),
+# Script action -> (AdminClient method, keys passed as positional args)
+SCRIPT_ACTIONS = {
+    "list_users": ("list_users", ()),
+    "get_token": ("get_token", ("owner_id",)),
+    "register": ("register_user", ("owner_id", "name")),
+    "update": ("update_user", ("owner_id", "name")),
+    "rotate": ("rotate_token", ("owner_id",)),
+    "delete": ("delete_user", ("owner_id",)),
+    "change_secret": ("change_secret", ("new_secret",)),
 }
 
 
-def admin_main(server_url: str, admin_secret: str):
-    """Run the interactive admin panel."""
-    client = AdminClient(server_url, admin_secret)
-
-    # Verify connection + secret
+def _load_script(script_path: str) -> list:
+    """Read actions from a JSON array or NDJSON file ("-" for stdin).
+
+    Returns one entry per action: the parsed value, or the decode error for
+    an NDJSON line that isn't valid JSON, so one bad line doesn't stop the rest.
+    """
+    if script_path == "-":
+        data = sys.stdin.buffer.read()
+    else:
+        with open(script_path, "rb") as f:
+            data = f.read()
+    if data.lstrip().startswith(b"["):
+        return orjson.loads(data)
+
+    entries = []
+    for line in data.splitlines():
+        if not line.strip():
+            continue
+        try:
+            entries.append(orjson.loads(line))
+        except orjson.JSONDecodeError as e:
+            entries.append(e)
+    return entries
+
+
+def _run_script(client: AdminClient, script_path: str, session: Path) -> int:
+    """Execute scripted actions without prompts. Returns the number of failures."""
     try:
-        client.ping()
-    except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] Cannot reach server at {server_url}")
-        console.print(f"  {e}")
-        sys.exit(1)
+        entries = _load_script(script_path)
+    except (OSError, orjson.JSONDecodeError) as e:
+        err_console.print(f"[bold red]Error:[/bold red] cannot read script {script_path}: {e}")
+        return 1
+
+    failures = 0
+    for i, entry in enumerate(entries, start=1):
+        if isinstance(entry, orjson.JSONDecodeError):
+            err_console.print(f"[bold red]Error:[/bold red] #{i}: invalid JSON: {entry}")
+            failures += 1
+            continue
+        if not isinstance(entry, dict):
+            err_console.print(f"[bold red]Error:[/bold red] #{i}: expected a JSON object, got {entry!r}")
+            failures += 1
+            continue
+        action = SCRIPT_ACTIONS.get(entry.get("action"))
+        if action is None:
+            err_console.print(f"[bold red]Error:[/bold red] #{i}: unknown action {entry.get('action')!r}")
+            failures += 1
+            continue
+
+        method, keys = action
+        try:
+            result = getattr(client, method)(*(entry[k] for k in keys))
+        except KeyError as e:
+            err_console.print(f"[bold red]Error:[/bold red] #{i}: missing field {e}")
+            failures += 1
+            continue
+        except TendrilsAPIError as e:
+            err_console.print(f"[bold red]Error:[/bold red] #{i}: {e.message}")
+            if e.status_code == 403:
+                _forget_session(session)
+            failures += 1
+            continue
+        except httpx.HTTPError as e:
+            err_console.print(f"[bold red]Error:[/bold red] #{i}: cannot reach server at {client.base_url}: {e}")
+            _forget_session(session)
+            failures += 1
+            continue
+        print(orjson.dumps(result).decode())
+    return failures
 
-    try:
-        client.list_users()
-    except TendrilsAPIError as e:
-        if e.status_code == 403:
-            console.print("[bold red]Error:[/bold red] Invalid admin secret.")
+
+# ── Main Loop ───────────────────────────────────────────────────────────────
+
+# Indexed by menu number; slot 0 is Exit and handled by the loop.
+_ACTIONS = (
+    None,
+    _action_list_users,
+    _action_get_token,
+    _action_register,
+    _action_update,
+    _action_rotate,
+    _action_delete,
+    _action_change_secret,
+)
+
+_CHOICE_RE = re.compile(f"[0-{len(_ACTIONS) - 1}]")
+
+
+def _startup(client: AdminClient) -> list:
+    """Run the reachability and secret checks concurrently.
+
+    Both calls share the client's pooled connection, and list_users primes
+    its ETag cache. Returns each call's result, or the exception it raised.
+    """
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(client.ping), pool.submit(client.list_users)]
+    return [f.exception() or f.result() for f in futures]
+
+
+def admin_main(server_url: str, admin_secret: str, script_path: str | None = None):
+    """Run the interactive admin panel, or a script of actions if script_path is set."""
+    session = _session_path(server_url, admin_secret)
+    client = AdminClient(server_url, admin_secret)
+
+    # Verify connection + secret, unless they were verified recently
+    if not _session_is_fresh(session):
+        ping_result, users_result = _startup(client)
+        if isinstance(ping_result, Exception):
+            err_console.print(f"[bold red]Error:[/bold red] Cannot reach server at {server_url}")
+            err_console.print(f"  {ping_result}")
             sys.exit(1)
-        raise
+
+        if isinstance(users_result, Exception):
+            if isinstance(users_result, TendrilsAPIError) and users_result.status_code == 403:
+                err_console.print("[bold red]Error:[/bold red] Invalid admin secret.")
+                sys.exit(1)
+            raise users_result
+
+        _remember_session(session)
+
+    if script_path:
+        try:
+            failures = _run_script(client, script_path, session)
+        finally:
+            client.close()
+        sys.exit(1 if failures else 0)
 
     console.print(f"\n[bold]Connected to {server_url}[/bold]\n")
 
@@ -182,19 +341,25 @@ def admin_main(server_url: str, admin_secret: str):
             _print_menu()
             choice = _input("Choose")
 
-            if choice == "0":
-                break
-
-            action = ACTIONS.get(choice)
-            if action is None:
+            if not _CHOICE_RE.fullmatch(choice):
                 console.print("  [red]Invalid choice.[/red]")
                 continue
 
-            label, func = action
+            idx = int(choice)
+            if idx == 0:
+                break
+
+            func = _ACTIONS[idx]
             try:
                 func(client)
             except TendrilsAPIError as e:
                 console.print(f"\n  [bold red]Error:[/bold red] {e.message}")
+                if e.status_code == 403:
+                    _forget_session(session)
+            except httpx.HTTPError as e:
+                console.print(f"\n  [bold red]Error:[/bold red] Cannot reach server at {server_url}")
+                console.print(f"  {e}")
+                _forget_session(session)
 
             _pause()
 
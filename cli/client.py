@@ -1,6 +1,42 @@
 """API client wrapper for all Tendrils Server HTTP calls."""
 
-import httpx
+import asyncio
+import atexit
+import functools
+import threading
+import uuid
+
+try:
+    import httpxr as httpx  # Rust-backed drop-in replacement, used when installed
+except ImportError:
+    import httpx
+import ijson
+import orjson
+
+# Keep connections alive across menu actions / prompt cycles instead of
+# re-handshaking TLS between calls.
+_POOL_LIMITS = httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60.0)
+
+# Max in-flight requests for the bulk admin helpers.
+_FAN_OUT_LIMIT = 16
+
+# AsyncAdminClient.enqueue flushes after this many calls or this many seconds,
+# retrying a batch whose POST failed in transit this many times.
+_BATCH_MAX_SIZE = 50
+_BATCH_MAX_WAIT = 0.05
+_BATCH_RETRIES = 2
+
+# An SSE stream silent for this long is treated as stalled and reopened;
+# servers are expected to send heartbeat comments more often than this.
+_EVENTS_READ_TIMEOUT = 30.0
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_transport() -> httpx.HTTPTransport:
+    """Connection pool shared by every sync client in the process."""
+    transport = httpx.HTTPTransport(http2=True, limits=_POOL_LIMITS)
+    atexit.register(transport.close)
+    return transport
 
 
 class TendrilsAPIError(Exception):
@@ -12,141 +48,315 @@ class TendrilsAPIError(Exception):
         super().__init__(f"[{status_code}] {message}")
 
 
-class TendrilsClient:
-    def __init__(self, base_url: str, token: str):
-        self.base_url = base_url.rstrip("/")
-        self.http = httpx.Client(
-            timeout=30.0,
-            headers={"Authorization": f"Bearer {token}"},
-        )
+def _error_message(body) -> str | None:
+    """Pull the message out of a FastAPI-style error body, if it has one."""
+    if not isinstance(body, dict):
+        return None
+    detail = body.get("detail")
+    if isinstance(detail, list):
+        return "; ".join(item.get("msg", str(item)) if isinstance(item, dict) else str(item) for item in detail)
+    return detail or body.get("message")
+
+
+def normalize_state(state: dict) -> dict:
+    """Give a game/state response a canonical round_number field, in place.
+
+    Some server versions send the round as "round"; after this callers only
+    need state.get("round_number").
+    """
+    if "round_number" not in state and "round" in state:
+        state["round_number"] = state["round"]
+    return state
 
-    def _url(self, path: str) -> str:
-        return f"{self.base_url}{path}"
+
+class _ResponseHandling:
+    """Response decoding shared by the sync and async clients."""
 
     def _handle_response(self, resp: httpx.Response) -> dict | list:
         if resp.status_code >= 400:
             try:
-                body = resp.json()
-                if "detail" in body:
-                    detail = body["detail"]
-                    if isinstance(detail, list):
-                        msg = "; ".join(item.get("msg", str(item)) for item in detail)
-                    else:
-                        msg = str(detail)
-                elif "message" in body:
-                    msg = body["message"]
-                else:
-                    msg = str(body)
+                msg = _error_message(orjson.loads(resp.content)) if resp.content else None
             except Exception:
-                msg = resp.text or f"HTTP {resp.status_code}"
-            raise TendrilsAPIError(resp.status_code, msg)
-        return resp.json()
+                msg = None
+            msg = msg or resp.text
+            raise TendrilsAPIError(resp.status_code, str(msg) if msg else f"HTTP {resp.status_code}")
+        return orjson.loads(resp.content)
+
+
+class _GameEndpoints:
+    """Game endpoint URLs, shared by TendrilsClient and AsyncTendrilsClient."""
+
+    def _init_urls(self):
+        """Precompute endpoint URLs once instead of formatting them per call."""
+        self._root_url = f"{self.base_url}/"
+        self._game_url = f"{self.base_url}/game"
+        self._join_url = f"{self.base_url}/game/join"
+        self._start_url = f"{self.base_url}/game/start"
+        self._state_url = f"{self.base_url}/game/state"
+        self._action_url = f"{self.base_url}/game/action"
+        self._actions_url = f"{self.base_url}/game/actions"
+        self._log_url = f"{self.base_url}/game/log"
+        self._history_url = f"{self.base_url}/game/history"
+        self._events_url = f"{self.base_url}/game/events"
+
+
+class _AdminEndpoints:
+    """Admin endpoint URLs, shared by AdminClient and AsyncAdminClient."""
+
+    def _init_urls(self):
+        """Precompute endpoint URLs once instead of formatting them per call."""
+        self._root_url = f"{self.base_url}/"
+        self._users_url = f"{self.base_url}/admin/users"
+        self._register_url = f"{self.base_url}/admin/register"
+        self._secret_url = f"{self.base_url}/admin/secret"
+        self._batch_url = f"{self.base_url}/admin/batch"
+        self._user_tpl = f"{self.base_url}/admin/users/{{owner_id}}"
+        self._token_tpl = f"{self.base_url}/admin/users/{{owner_id}}/token"
+        self._rotate_tpl = f"{self.base_url}/admin/users/{{owner_id}}/rotate-token"
+
+
+class _BaseClient(_ResponseHandling):
+    """Shared plumbing for the sync API clients."""
+
+    def __init__(
+        self,
+        base_url: str,
+        headers: dict,
+        transport: httpx.BaseTransport | None = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        # Auth headers live on the Client. Without an explicit transport the
+        # pool is the process-wide one, which outlives any one client; a
+        # transport passed in belongs to this client and is closed with it.
+        self._uses_shared_pool = transport is None
+        self.http = httpx.Client(
+            transport=transport or _shared_transport(),
+            timeout=30.0,
+            headers=headers,
+        )
+
+    def _iter_items(self, url: str):
+        """Yield the elements of a JSON array (or NDJSON) response as they arrive."""
+        with self.http.stream("GET", url) as resp:
+            if resp.status_code >= 400:
+                resp.read()
+                self._handle_response(resp)
+
+            if resp.headers.get("content-type", "").startswith("application/x-ndjson"):
+                for line in resp.iter_lines():
+                    if line:
+                        yield orjson.loads(line)
+                return
+
+            items = ijson.sendable_list()
+            parser = ijson.items_coro(items, "item", use_float=True)
+            for chunk in resp.iter_bytes():
+                parser.send(chunk)
+                yield from items
+                del items[:]
+            parser.close()
+            yield from items
+
+    def close(self):
+        # Closing the Client closes its transport; the shared pool is closed at exit.
+        if not self._uses_shared_pool:
+            self.http.close()
+
+
+class _AsyncBaseClient(_ResponseHandling):
+    """Shared plumbing for the async API clients."""
+
+    def __init__(self, base_url: str, headers: dict):
+        self.base_url = base_url.rstrip("/")
+        self.http = httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            limits=_POOL_LIMITS,
+            headers=headers,
+        )
+
+    async def close(self):
+        await self.http.aclose()
+
+
+class TendrilsClient(_GameEndpoints, _BaseClient):
+    """API client for Tendrils Server game endpoints."""
+
+    def __init__(
+        self,
+        base_url: str,
+        token: str,
+        transport: httpx.BaseTransport | None = None,
+    ):
+        super().__init__(base_url, {"Authorization": f"Bearer {token}"}, transport)
+        self._init_urls()
 
     def ping(self) -> dict:
-        resp = self.http.get(self._url("/"))
+        resp = self.http.get(self._root_url)
         return self._handle_response(resp)
 
     def get_game(self) -> dict:
-        resp = self.http.get(self._url("/game"))
-        return self._handle_response(resp)
+        resp = self.http.get(self._game_url)
+        return normalize_state(self._handle_response(resp))
 
     def join_game(self, character_data: dict) -> dict:
-        resp = self.http.post(self._url("/game/join"), json=character_data)
+        resp = self.http.post(self._join_url, json=character_data)
         return self._handle_response(resp)
 
     def start_game(self) -> dict:
-        resp = self.http.post(self._url("/game/start"))
+        resp = self.http.post(self._start_url)
         return self._handle_response(resp)
 
     def get_state(self) -> dict:
-        resp = self.http.get(self._url("/game/state"))
-        return self._handle_response(resp)
+        resp = self.http.get(self._state_url)
+        return normalize_state(self._handle_response(resp))
 
     def submit_action(self, action_data: dict) -> dict:
-        resp = self.http.post(self._url("/game/action"), json=action_data)
+        resp = self.http.post(self._action_url, json=action_data)
         return self._handle_response(resp)
 
-    def get_log(self) -> list:
-        resp = self.http.get(self._url("/game/log"))
+    def submit_actions_batch(self, actions: list[dict]) -> list[dict]:
+        """Submit several actions for one turn in a single request.
+
+        Returns one action result per submitted action, in order. Servers
+        without batch support answer 404/405.
+        """
+        resp = self.http.post(self._actions_url, json={"actions": actions})
         return self._handle_response(resp)
 
+    def get_log(self) -> list:
+        return list(self.iter_log())
+
+    def iter_log(self):
+        """Stream combat log events without buffering the whole response."""
+        return self._iter_items(self._log_url)
+
     def get_history(self) -> list:
-        resp = self.http.get(self._url("/game/history"))
+        resp = self.http.get(self._history_url)
         return self._handle_response(resp)
 
-    def close(self):
-        self.http.close()
+    def subscribe_state(self, callback) -> threading.Event:
+        """Push state updates to callback(state) from a background thread via SSE.
 
+        The stream is opened on that thread, so a slow or silent server never
+        blocks the caller. Returns an Event that is set while the stream is
+        connected; it stays clear if the server has no event stream, in which
+        case the caller should keep polling get_state().
+        """
+        connected = threading.Event()
+        threading.Thread(target=self._read_events, args=(callback, connected), daemon=True).start()
+        return connected
 
-class AdminClient:
-    """API client for Tendrils Server admin endpoints."""
-
-    def __init__(self, base_url: str, admin_secret: str):
-        self.base_url = base_url.rstrip("/")
-        self.http = httpx.Client(
-            timeout=30.0,
-            headers={"X-Admin-Secret": admin_secret},
+    def _read_events(self, callback, connected: threading.Event):
+        # The stream gets its own HTTP/1.1 connection: on the shared HTTP/2
+        # pool a blocked stream read would hold the connection's read lock
+        # and stall every other request behind it.
+        http = httpx.Client(
+            timeout=httpx.Timeout(30.0, read=_EVENTS_READ_TIMEOUT),
+            headers={**self.http.headers, "Accept": "text/event-stream"},
         )
+        try:
+            # A quiet stream times out and is reopened; anything else ends it
+            while self._stream_events(http, callback, connected):
+                pass
+        finally:
+            connected.clear()
+            http.close()
 
-    def _url(self, path: str) -> str:
-        return f"{self.base_url}{path}"
+    def _stream_events(self, http: httpx.Client, callback, connected: threading.Event) -> bool:
+        """Read one SSE connection. Returns True if it should be reopened."""
+        try:
+            with http.stream("GET", self._events_url) as resp:
+                if resp.status_code >= 400 or not resp.headers.get("content-type", "").startswith("text/event-stream"):
+                    return False
+                connected.set()
+                event, data = "", []
+                for line in resp.iter_lines():
+                    if line.startswith("data:"):
+                        data.append(line[5:].removeprefix(" "))
+                    elif line.startswith("event:"):
+                        event = line[6:].strip()
+                    elif not line:
+                        # Blank line ends an event; only unnamed or "state" events carry state
+                        if data and event in ("", "state"):
+                            self._push_state("\n".join(data), callback)
+                        event, data = "", []
+        except httpx.ReadTimeout:
+            connected.clear()
+            return True
+        except httpx.HTTPError:
+            pass
+        return False
 
-    def _handle_response(self, resp: httpx.Response) -> dict | list:
-        if resp.status_code >= 400:
-            try:
-                body = resp.json()
-                if "detail" in body:
-                    detail = body["detail"]
-                    if isinstance(detail, list):
-                        msg = "; ".join(item.get("msg", str(item)) for item in detail)
-                    else:
-                        msg = str(detail)
-                elif "message" in body:
-                    msg = body["message"]
-                else:
-                    msg = str(body)
-            except Exception:
-                msg = resp.text or f"HTTP {resp.status_code}"
-            raise TendrilsAPIError(resp.status_code, msg)
-        return resp.json()
+    @staticmethod
+    def _push_state(data: str, callback):
+        # Drop bad events here rather than let a traceback land in the prompt
+        try:
+            state = orjson.loads(data)
+            if isinstance(state, dict):
+                callback(normalize_state(state))
+        except Exception:
+            pass
+
+
+class AdminClient(_AdminEndpoints, _BaseClient):
+    """API client for Tendrils Server admin endpoints."""
+
+    def __init__(
+        self,
+        base_url: str,
+        admin_secret: str,
+        transport: httpx.BaseTransport | None = None,
+    ):
+        super().__init__(base_url, {"X-Admin-Secret": admin_secret}, transport)
+        self._init_urls()
+        # Last list_users body + its ETag, reused when the server answers 304
+        self._users_etag: str | None = None
+        self._users_cache: list | None = None
 
     def ping(self) -> dict:
-        resp = self.http.get(self._url("/"))
+        resp = self.http.get(self._root_url)
         return self._handle_response(resp)
 
     def list_users(self) -> list:
-        resp = self.http.get(self._url("/admin/users"))
-        return self._handle_response(resp)
+        headers = {"If-None-Match": self._users_etag} if self._users_etag else None
+        resp = self.http.get(self._users_url, headers=headers)
+        if resp.status_code == 304:
+            return self._users_cache
+        users = self._handle_response(resp)
+        self._users_etag = resp.headers.get("etag")
+        self._users_cache = users
+        return users
 
     def get_token(self, owner_id: str) -> dict:
-        resp = self.http.get(self._url(f"/admin/users/{owner_id}/token"))
+        resp = self.http.get(self._token_tpl.format(owner_id=owner_id))
         return self._handle_response(resp)
 
     def register_user(self, owner_id: str, name: str) -> dict:
         resp = self.http.post(
-            self._url("/admin/register"),
+            self._register_url,
             json={"owner_id": owner_id, "name": name},
         )
         return self._handle_response(resp)
 
     def update_user(self, owner_id: str, name: str) -> dict:
         resp = self.http.patch(
-            self._url(f"/admin/users/{owner_id}"),
+            self._user_tpl.format(owner_id=owner_id),
             json={"name": name},
         )
         return self._handle_response(resp)
 
     def rotate_token(self, owner_id: str) -> dict:
-        resp = self.http.post(self._url(f"/admin/users/{owner_id}/rotate-token"))
+        resp = self.http.post(self._rotate_tpl.format(owner_id=owner_id))
         return self._handle_response(resp)
 
     def delete_user(self, owner_id: str) -> dict:
-        resp = self.http.delete(self._url(f"/admin/users/{owner_id}"))
+        resp = self.http.delete(self._user_tpl.format(owner_id=owner_id))
         return self._handle_response(resp)
 
     def change_secret(self, new_secret: str) -> dict:
         resp = self.http.put(
-            self._url("/admin/secret"),
+            self._secret_url,
             json={"new_secret": new_secret},
         )
         result = self._handle_response(resp)
@@ -154,5 +364,252 @@ class AdminClient:
         self.http.headers["X-Admin-Secret"] = new_secret
         return result
 
-    def close(self):
-        self.http.close()
+    def batch(self, calls: list[dict]) -> list[dict]:
+        """Run several admin calls in one round trip via /admin/batch.
+
+        Each call is {"method": ..., "path": ..., "body": ...}. A call may set
+        "input_from" to the index of an earlier call whose response it depends
+        on; the server runs independent calls concurrently and dependent ones
+        in later layers. Returns one sub-response per call, in order.
+        """
+        resp = self.http.post(self._batch_url, json={"requests": calls})
+        return self._handle_response(resp)
+
+    # The bulk helpers return one entry per owner id, in order: the response
+    # body, or the exception that call raised. One failure doesn't hide the
+    # others, which matters for rotate/delete since those calls still happened.
+
+    def get_many_tokens(self, owner_ids: list[str]) -> list[dict | Exception]:
+        """Fetch tokens for several users concurrently."""
+        return self._run_many("get_many_tokens", owner_ids)
+
+    def rotate_many(self, owner_ids: list[str]) -> list[dict | Exception]:
+        """Rotate tokens for several users concurrently."""
+        return self._run_many("rotate_many", owner_ids)
+
+    def delete_many(self, owner_ids: list[str]) -> list[dict | Exception]:
+        """Delete several users concurrently."""
+        return self._run_many("delete_many", owner_ids)
+
+    def _run_many(self, method: str, owner_ids: list[str]) -> list[dict | Exception]:
+        """Run a bulk helper on a short-lived AsyncAdminClient."""
+
+        async def run():
+            client = AsyncAdminClient(self.base_url, self.http.headers["X-Admin-Secret"])
+            try:
+                return await getattr(client, method)(owner_ids)
+            finally:
+                await client.close()
+
+        return asyncio.run(run())
+
+
+class AsyncTendrilsClient(_GameEndpoints, _AsyncBaseClient):
+    """Async mirror of TendrilsClient for issuing independent calls concurrently."""
+
+    def __init__(self, base_url: str, token: str):
+        super().__init__(base_url, {"Authorization": f"Bearer {token}"})
+        self._init_urls()
+
+    async def ping(self) -> dict:
+        resp = await self.http.get(self._root_url)
+        return self._handle_response(resp)
+
+    async def get_game(self) -> dict:
+        resp = await self.http.get(self._game_url)
+        return normalize_state(self._handle_response(resp))
+
+    async def join_game(self, character_data: dict) -> dict:
+        resp = await self.http.post(self._join_url, json=character_data)
+        return self._handle_response(resp)
+
+    async def start_game(self) -> dict:
+        resp = await self.http.post(self._start_url)
+        return self._handle_response(resp)
+
+    async def get_state(self) -> dict:
+        resp = await self.http.get(self._state_url)
+        return normalize_state(self._handle_response(resp))
+
+    async def submit_action(self, action_data: dict) -> dict:
+        resp = await self.http.post(self._action_url, json=action_data)
+        return self._handle_response(resp)
+
+    async def submit_actions_batch(self, actions: list[dict]) -> list[dict]:
+        resp = await self.http.post(self._actions_url, json={"actions": actions})
+        return self._handle_response(resp)
+
+    async def get_log(self) -> list:
+        resp = await self.http.get(self._log_url)
+        return self._handle_response(resp)
+
+    async def get_history(self) -> list:
+        resp = await self.http.get(self._history_url)
+        return self._handle_response(resp)
+
+
+class AsyncAdminClient(_AdminEndpoints, _AsyncBaseClient):
+    """Async mirror of AdminClient for issuing independent calls concurrently."""
+
+    def __init__(self, base_url: str, admin_secret: str):
+        super().__init__(base_url, {"X-Admin-Secret": admin_secret})
+        self._init_urls()
+        # Write-behind queue for enqueue(), created on first use
+        self._queue: asyncio.Queue | None = None
+        self._flusher: asyncio.Task | None = None
+
+    async def close(self):
+        if self._flusher is not None:
+            if not self._flusher.done():
+                await self._queue.join()  # send anything still queued
+            self._flusher.cancel()
+        await super().close()
+
+    async def ping(self) -> dict:
+        resp = await self.http.get(self._root_url)
+        return self._handle_response(resp)
+
+    async def list_users(self) -> list:
+        resp = await self.http.get(self._users_url)
+        return self._handle_response(resp)
+
+    async def get_token(self, owner_id: str) -> dict:
+        resp = await self.http.get(self._token_tpl.format(owner_id=owner_id))
+        return self._handle_response(resp)
+
+    async def register_user(self, owner_id: str, name: str) -> dict:
+        resp = await self.http.post(
+            self._register_url,
+            json={"owner_id": owner_id, "name": name},
+        )
+        return self._handle_response(resp)
+
+    async def update_user(self, owner_id: str, name: str) -> dict:
+        resp = await self.http.patch(
+            self._user_tpl.format(owner_id=owner_id),
+            json={"name": name},
+        )
+        return self._handle_response(resp)
+
+    async def rotate_token(self, owner_id: str) -> dict:
+        resp = await self.http.post(self._rotate_tpl.format(owner_id=owner_id))
+        return self._handle_response(resp)
+
+    async def delete_user(self, owner_id: str) -> dict:
+        resp = await self.http.delete(self._user_tpl.format(owner_id=owner_id))
+        return self._handle_response(resp)
+
+    async def change_secret(self, new_secret: str) -> dict:
+        resp = await self.http.put(
+            self._secret_url,
+            json={"new_secret": new_secret},
+        )
+        result = self._handle_response(resp)
+        # Update header so subsequent requests use the new secret
+        self.http.headers["X-Admin-Secret"] = new_secret
+        return result
+
+    async def batch(self, calls: list[dict]) -> list[dict]:
+        """Run several admin calls in one round trip. See AdminClient.batch."""
+        resp = await self.http.post(self._batch_url, json={"requests": calls})
+        return self._handle_response(resp)
+
+    async def get_many_tokens(self, owner_ids: list[str]) -> list[dict | Exception]:
+        return await self._fan_out(self.get_token, owner_ids)
+
+    async def rotate_many(self, owner_ids: list[str]) -> list[dict | Exception]:
+        return await self._fan_out(self.rotate_token, owner_ids)
+
+    async def delete_many(self, owner_ids: list[str]) -> list[dict | Exception]:
+        return await self._fan_out(self.delete_user, owner_ids)
+
+    async def _fan_out(self, func, owner_ids: list[str]) -> list[dict | Exception]:
+        """Call func(owner_id) for every id, at most _FAN_OUT_LIMIT at a time.
+
+        Returns one entry per id, in order: the result, or the exception
+        that call raised, so a single failure doesn't discard the rest.
+        """
+        sem = asyncio.Semaphore(_FAN_OUT_LIMIT)
+
+        async def call(owner_id: str) -> dict:
+            async with sem:
+                return await func(owner_id)
+
+        return await asyncio.gather(*(call(oid) for oid in owner_ids), return_exceptions=True)
+
+    def enqueue(self, method: str, path: str, body: dict | None = None) -> asyncio.Future:
+        """Queue an admin call to be sent with others in one /admin/batch POST.
+
+        The returned future resolves to the call's response body, or raises
+        TendrilsAPIError if that call failed. Every call carries an
+        idempotency key so a batch can be retried safely.
+        """
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+            self._flusher = asyncio.create_task(self._drain_queue())
+
+        request = {"method": method, "path": path, "idempotency_key": uuid.uuid4().hex}
+        if body is not None:
+            request["body"] = body
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((request, future))
+        return future
+
+    async def _drain_queue(self):
+        """Collect queued calls into batches and send them, forever."""
+        loop = asyncio.get_running_loop()
+        while True:
+            pending = [await self._queue.get()]
+            deadline = loop.time() + _BATCH_MAX_WAIT
+            while len(pending) < _BATCH_MAX_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    pending.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self._flush(pending)
+            except Exception as e:
+                # A bad batch must not kill the flusher; fail its callers instead
+                for _, future in pending:
+                    if not future.done():
+                        future.set_exception(e)
+            finally:
+                for _ in pending:
+                    self._queue.task_done()
+
+    async def _flush(self, pending: list[tuple[dict, asyncio.Future]]):
+        """Send one batch and resolve each caller's future with its sub-response."""
+        requests = [request for request, _ in pending]
+        for attempt in range(_BATCH_RETRIES + 1):
+            try:
+                responses = await self.batch(requests)
+                break
+            except httpx.TransportError as e:
+                if attempt < _BATCH_RETRIES:
+                    continue
+                error = e
+            except Exception as e:
+                error = e
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for i, (_, future) in enumerate(pending):
+            if future.done():
+                continue
+            try:
+                status = responses[i].get("status", 200)
+                body = responses[i].get("body")
+                error = TendrilsAPIError(status, str(_error_message(body) or body)) if status >= 400 else None
+            except Exception:
+                # Missing entry, non-dict entry or a body that isn't a list
+                error = TendrilsAPIError(502, "Missing or malformed batch sub-response")
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(body)
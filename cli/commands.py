@@ -1,12 +1,20 @@
 """Command parsing and dispatch for the interactive CLI."""
 
 import math
+import sys
 import time
 
-from cli.client import TendrilsClient, TendrilsAPIError
-from cli.game_session import GameSession, PRESETS
+import orjson
+
+from cli.client import TendrilsClient, TendrilsAPIError, normalize_state
+from cli.game_session import GameSession, PRESETS, instantiate
 from cli import display
-from cli.display import _all_characters
+
+
+_QUIT_VERBS = frozenset({"quit", "exit", "q"})
+
+# Commands that never change game state, so the cached state survives them
+_READ_ONLY_VERBS = frozenset({"help", "h", "?", "games", "game", "status", "s", "map", "m", "log"})
 
 
 def handle_command(cmd: str, client: TendrilsClient, session: GameSession) -> bool:
@@ -18,39 +26,19 @@ def handle_command(cmd: str, client: TendrilsClient, session: GameSession) -> bo
     verb = parts[0].lower()
     args = parts[1:]
 
+    if verb in _QUIT_VERBS:
+        return False
+
+    handler = _COMMANDS.get(verb)
+    if handler is None:
+        display.print_error(f"Unknown command: '{verb}'. Type 'help' for commands.")
+        return True
+
+    if verb not in _READ_ONLY_VERBS:
+        session.invalidate_state()
+
     try:
-        if verb in ("quit", "exit", "q"):
-            return False
-        elif verb in ("help", "h", "?"):
-            display.print_help()
-        elif verb == "join":
-            _cmd_join(args, client, session)
-        elif verb == "start":
-            _cmd_start(client, session)
-        elif verb in ("games", "game"):
-            _cmd_game_info(client, session)
-        elif verb in ("status", "s"):
-            _cmd_status(client, session)
-        elif verb in ("map", "m"):
-            _cmd_map(client, session)
-        elif verb == "log":
-            _cmd_log(client, session)
-        elif verb == "move":
-            _cmd_move(args, client, session)
-        elif verb == "attack":
-            _cmd_attack(args, client, session)
-        elif verb == "dodge":
-            _cmd_dodge(client, session)
-        elif verb == "dash":
-            _cmd_dash(args, client, session)
-        elif verb == "disengage":
-            _cmd_disengage(client, session)
-        elif verb in ("end", "done"):
-            _cmd_end_turn(client, session)
-        elif verb == "auto":
-            _cmd_auto(client, session)
-        else:
-            display.print_error(f"Unknown command: '{verb}'. Type 'help' for commands.")
+        handler(args, client, session)
     except TendrilsAPIError as e:
         display.print_error(e.message)
     except Exception as e:
@@ -72,7 +60,7 @@ def _cmd_join(args: list, client: TendrilsClient, session: GameSession):
     if preset_name == "custom":
         char_data = _build_custom_character()
     elif preset_name in PRESETS:
-        char_data = PRESETS[preset_name].copy()
+        char_data = instantiate(preset_name)
     else:
         display.print_error(f"Unknown preset '{preset_name}'. Options: fighter, rogue, barbarian, monk, custom")
         return
@@ -88,53 +76,111 @@ def _cmd_join(args: list, client: TendrilsClient, session: GameSession):
         display.print_success(f"Joined! Character ID: {char_id}")
 
 
+_ABILITIES = ("strength", "dexterity", "constitution", "intelligence", "wisdom", "charisma")
+
+# Flat custom-character fields and their defaults (abilities default to 10)
+_CUSTOM_DEFAULTS = {
+    "name": "Custom Hero",
+    "max_hp": 25,
+    "armor_class": 14,
+    "speed": 30,
+    **{stat: 10 for stat in _ABILITIES},
+    "weapon_name": "Shortsword",
+    "attack_bonus": 4,
+    "damage_dice": "1d6",
+    "damage_bonus": 2,
+    "damage_type": "slashing",
+}
+
+
 def _build_custom_character() -> dict:
+    if not sys.stdin.isatty():
+        # Scripted input: one JSON object of fields on the next line, no prompts
+        line = sys.stdin.readline()
+        overrides = orjson.loads(line) if line.strip() else {}
+        return _custom_character(_scripted_fields(overrides))
+
     display.console.print("\n[bold]Custom Character Builder[/bold]\n")
-    name = input("  Name: ").strip() or "Custom Hero"
+    fields = {}
+    fields["name"] = input("  Name: ").strip() or _CUSTOM_DEFAULTS["name"]
 
-    def _int_input(prompt: str, default: int) -> int:
+    def _int_input(key: str, prompt: str) -> int:
+        default = _CUSTOM_DEFAULTS[key]
         val = input(f"  {prompt} [{default}]: ").strip()
         try:
             return int(val) if val else default
         except ValueError:
             return default
 
-    max_hp = _int_input("Max HP", 25)
-    armor_class = _int_input("Armor Class", 14)
-    speed = _int_input("Speed", 30)
+    def _str_input(key: str, prompt: str) -> str:
+        return input(f"  {prompt} [{_CUSTOM_DEFAULTS[key]}]: ").strip() or _CUSTOM_DEFAULTS[key]
+
+    fields["max_hp"] = _int_input("max_hp", "Max HP")
+    fields["armor_class"] = _int_input("armor_class", "Armor Class")
+    fields["speed"] = _int_input("speed", "Speed")
 
     display.console.print("\n  [dim]Ability Scores (default 10):[/dim]")
-    abilities = {}
-    for stat in ("strength", "dexterity", "constitution", "intelligence", "wisdom", "charisma"):
-        abilities[stat] = _int_input(f"  {stat.capitalize()}", 10)
+    for stat in _ABILITIES:
+        fields[stat] = _int_input(stat, f"  {stat.capitalize()}")
 
     display.console.print("\n  [dim]Weapon:[/dim]")
-    weapon_name = input("  Weapon name [Shortsword]: ").strip() or "Shortsword"
-    attack_bonus = _int_input("Attack bonus", 4)
-    damage_dice = input("  Damage dice [1d6]: ").strip() or "1d6"
-    damage_bonus = _int_input("Damage bonus", 2)
-    damage_type = input("  Damage type [slashing]: ").strip() or "slashing"
-
+    fields["weapon_name"] = _str_input("weapon_name", "Weapon name")
+    fields["attack_bonus"] = _int_input("attack_bonus", "Attack bonus")
+    fields["damage_dice"] = _str_input("damage_dice", "Damage dice")
+    fields["damage_bonus"] = _int_input("damage_bonus", "Damage bonus")
+    fields["damage_type"] = _str_input("damage_type", "Damage type")
+
+    return _custom_character(fields)
+
+
+def _scripted_fields(overrides) -> dict:
+    """Validate scripted custom-character fields and merge them over the defaults."""
+    if not isinstance(overrides, dict):
+        raise ValueError("Custom character input must be a JSON object of fields.")
+    unknown = overrides.keys() - _CUSTOM_DEFAULTS.keys()
+    if unknown:
+        raise ValueError(
+            f"Unknown custom character field(s): {', '.join(sorted(unknown))}. "
+            f"Expected: {', '.join(_CUSTOM_DEFAULTS)}"
+        )
+
+    fields = dict(_CUSTOM_DEFAULTS)
+    for key, val in overrides.items():
+        if isinstance(_CUSTOM_DEFAULTS[key], int):
+            # Numeric strings are accepted like _int_input does, but a bad value
+            # is an error rather than a silent fall back to the default
+            if isinstance(val, str) and val.strip().removeprefix("-").isdecimal():
+                val = int(val)
+            if isinstance(val, bool) or not isinstance(val, int):
+                raise ValueError(f"Custom character field '{key}' must be an integer, got {val!r}.")
+        elif not isinstance(val, str):
+            raise ValueError(f"Custom character field '{key}' must be a string, got {val!r}.")
+        fields[key] = val
+    return fields
+
+
+def _custom_character(fields: dict) -> dict:
+    """Assemble the join payload from flat custom-character fields."""
     return {
-        "name": name,
-        "max_hp": max_hp,
-        "armor_class": armor_class,
-        "speed": speed,
-        "ability_scores": abilities,
+        "name": fields["name"],
+        "max_hp": fields["max_hp"],
+        "armor_class": fields["armor_class"],
+        "speed": fields["speed"],
+        "ability_scores": {stat: fields[stat] for stat in _ABILITIES},
         "attacks": [
             {
-                "name": weapon_name,
-                "attack_bonus": attack_bonus,
-                "damage_dice": damage_dice,
-                "damage_bonus": damage_bonus,
-                "damage_type": damage_type,
+                "name": fields["weapon_name"],
+                "attack_bonus": fields["attack_bonus"],
+                "damage_dice": fields["damage_dice"],
+                "damage_bonus": fields["damage_bonus"],
+                "damage_type": fields["damage_type"],
                 "reach": 5,
             }
         ],
     }
 
 
-def _cmd_start(client: TendrilsClient, session: GameSession):
+def _cmd_start(args: list, client: TendrilsClient, session: GameSession):
     display.print_info("Starting combat...")
     result = client.start_game()
     session.game_status = "active"
@@ -147,7 +193,7 @@ def _cmd_start(client: TendrilsClient, session: GameSession):
     _show_current_state(client, session)
 
 
-def _cmd_game_info(client: TendrilsClient, session: GameSession):
+def _cmd_game_info(args: list, client: TendrilsClient, session: GameSession):
     result = client.get_game()
     display.console.print(f"\n[bold]Game Status:[/bold] {result.get('status', '?')}")
     session.game_status = result.get("status", session.game_status)
@@ -179,24 +225,33 @@ def _require_character(session: GameSession) -> bool:
     return True
 
 
+def _parse_xy(args: list) -> tuple[int, int] | None:
+    """Parse the first two args as integer coordinates, or None if they aren't."""
+    if len(args) < 2:
+        return None
+    x, y = args[0], args[1]
+    if not (x.removeprefix("-").isdecimal() and y.removeprefix("-").isdecimal()):
+        return None
+    return int(x), int(y)
+
+
 def _cmd_move(args: list, client: TendrilsClient, session: GameSession):
     if not _require_character(session):
         return
     if len(args) < 2:
         display.print_error("Usage: move X Y")
         return
-    try:
-        x, y = int(args[0]), int(args[1])
-    except ValueError:
+    xy = _parse_xy(args)
+    if xy is None:
         display.print_error("Coordinates must be integers.")
         return
 
     result = client.submit_action({
         "action_type": "move",
-        "target_position": [x, y],
+        "target_position": list(xy),
     })
     display.print_action_result(result)
-    _check_game_over(client, session)
+    _check_game_over(client, session, result)
 
 
 def _cmd_attack(args: list, client: TendrilsClient, session: GameSession):
@@ -212,15 +267,15 @@ def _cmd_attack(args: list, client: TendrilsClient, session: GameSession):
 
     result = client.submit_action(action)
     display.print_action_result(result)
-    _check_game_over(client, session)
+    _check_game_over(client, session, result)
 
 
-def _cmd_dodge(client: TendrilsClient, session: GameSession):
+def _cmd_dodge(args: list, client: TendrilsClient, session: GameSession):
     if not _require_character(session):
         return
     result = client.submit_action({"action_type": "dodge"})
     display.print_action_result(result)
-    _check_game_over(client, session)
+    _check_game_over(client, session, result)
 
 
 def _cmd_dash(args: list, client: TendrilsClient, session: GameSession):
@@ -229,40 +284,39 @@ def _cmd_dash(args: list, client: TendrilsClient, session: GameSession):
     if len(args) < 2:
         display.print_error("Usage: dash X Y")
         return
-    try:
-        x, y = int(args[0]), int(args[1])
-    except ValueError:
+    xy = _parse_xy(args)
+    if xy is None:
         display.print_error("Coordinates must be integers.")
         return
 
     result = client.submit_action({
         "action_type": "dash",
-        "target_position": [x, y],
+        "target_position": list(xy),
     })
     display.print_action_result(result)
-    _check_game_over(client, session)
+    _check_game_over(client, session, result)
 
 
-def _cmd_disengage(client: TendrilsClient, session: GameSession):
+def _cmd_disengage(args: list, client: TendrilsClient, session: GameSession):
     if not _require_character(session):
         return
     result = client.submit_action({"action_type": "disengage"})
     display.print_action_result(result)
-    _check_game_over(client, session)
+    _check_game_over(client, session, result)
 
 
-def _cmd_end_turn(client: TendrilsClient, session: GameSession):
+def _cmd_end_turn(args: list, client: TendrilsClient, session: GameSession):
     if not _require_character(session):
         return
     result = client.submit_action({"action_type": "end_turn"})
     display.print_action_result(result)
-    _check_game_over(client, session)
+    _check_game_over(client, session, result)
 
 
 # ── Info ────────────────────────────────────────────────────────────────────
 
 
-def _cmd_status(client: TendrilsClient, session: GameSession):
+def _cmd_status(args: list, client: TendrilsClient, session: GameSession):
     if not _require_character(session):
         return
     state = client.get_state()
@@ -270,7 +324,7 @@ def _cmd_status(client: TendrilsClient, session: GameSession):
     display.print_state(state)
 
 
-def _cmd_map(client: TendrilsClient, session: GameSession):
+def _cmd_map(args: list, client: TendrilsClient, session: GameSession):
     if not _require_character(session):
         return
     state = client.get_state()
@@ -278,27 +332,34 @@ def _cmd_map(client: TendrilsClient, session: GameSession):
     display.print_map(state)
 
 
-def _cmd_log(client: TendrilsClient, session: GameSession):
-    events = client.get_log()
-    if not events:
-        # Log is archived after combat ends; fall back to combat history
-        try:
-            history = client.get_history()
-            if history:
-                # Show the most recent combat log
-                latest = history[-1] if isinstance(history, list) else history
-                events = latest.get("events", latest.get("log", []))
-                if events:
-                    display.console.print("[dim](Showing last combat log)[/dim]")
-        except TendrilsAPIError:
-            pass
+def _cmd_log(args: list, client: TendrilsClient, session: GameSession):
+    # Print events as they stream in instead of buffering the whole log
+    streamed = False
+    for event in client.iter_log():
+        display.print_log_event(event)
+        streamed = True
+    if streamed:
+        return
+
+    # Log is archived after combat ends; fall back to combat history
+    events = []
+    try:
+        history = client.get_history()
+        if history:
+            # Show the most recent combat log
+            latest = history[-1] if isinstance(history, list) else history
+            events = latest.get("events", latest.get("log", []))
+            if events:
+                display.console.print("[dim](Showing last combat log)[/dim]")
+    except TendrilsAPIError:
+        pass
     display.print_log(events)
 
 
 # ── Utility ─────────────────────────────────────────────────────────────────
 
 
-def _cmd_auto(client: TendrilsClient, session: GameSession):
+def _cmd_auto(args: list, client: TendrilsClient, session: GameSession):
     """Auto-play current character with simple AI."""
     if not _require_character(session):
         return
@@ -310,8 +371,52 @@ def _cmd_auto(client: TendrilsClient, session: GameSession):
         display.console.print("\n[yellow]Auto-play stopped.[/yellow]")
 
 
+def _cmd_help(args: list, client: TendrilsClient, session: GameSession):
+    display.print_help()
+
+
+# ── Dispatch Table ──────────────────────────────────────────────────────────
+
+# Every handler takes (args, client, session); aliases map to the same handler.
+_COMMANDS = {
+    "help": _cmd_help,
+    "h": _cmd_help,
+    "?": _cmd_help,
+    "join": _cmd_join,
+    "start": _cmd_start,
+    "games": _cmd_game_info,
+    "game": _cmd_game_info,
+    "status": _cmd_status,
+    "s": _cmd_status,
+    "map": _cmd_map,
+    "m": _cmd_map,
+    "log": _cmd_log,
+    "move": _cmd_move,
+    "attack": _cmd_attack,
+    "dodge": _cmd_dodge,
+    "dash": _cmd_dash,
+    "disengage": _cmd_disengage,
+    "end": _cmd_end_turn,
+    "done": _cmd_end_turn,
+    "auto": _cmd_auto,
+}
+
+
 # ── Internal Helpers ────────────────────────────────────────────────────────
 
+# Attack range of ~1.5 grid squares, squared for comparison against _dist2
+_ADJACENT_DIST2 = 1.5 ** 2
+
+# Status codes meaning the server has no /game/actions batch endpoint
+_BATCH_UNSUPPORTED = (404, 405, 501)
+
+# Game-level status values; distinguishes them from per-action status fields
+_GAME_STATUSES = frozenset({"waiting", "active", "completed"})
+
+# Auto-play polling backoff while waiting for our turn (seconds)
+_POLL_MIN = 0.05
+_POLL_MAX = 1.0
+
 
 def _show_current_state(client: TendrilsClient, session: GameSession):
     """Fetch and display current state + map."""
@@ -327,7 +432,9 @@ def _show_current_state(client: TendrilsClient, session: GameSession):
 
 
 def _update_session_from_state(state: dict, session: GameSession):
-    """Update session status from a state response."""
+    """Update session status (and the cached state) from a state response."""
+    if state.get("your_character"):
+        session.cache_state(state)
     status = state.get("status")
     if status:
         # Server auto-transitions completed→waiting, so winner_id in waiting means game over
@@ -337,14 +444,32 @@ def _update_session_from_state(state: dict, session: GameSession):
             session.game_status = status
 
 
-def _check_game_over(client: TendrilsClient, session: GameSession):
-    """After an action, check if the game ended."""
+def _embedded_state(result: dict) -> dict | None:
+    """Return the post-action state if the server included it in an action response."""
+    state = result.get("state")
+    if isinstance(state, dict) and state.get("your_character"):
+        return normalize_state(state)
+    return None
+
+
+def _check_game_over(client: TendrilsClient, session: GameSession, result: dict):
+    """After an action, check if the game ended.
+
+    Reads the game status from the action response (or the state embedded
+    in it) when the server includes one, and only fetches state otherwise.
+    """
+    state = _embedded_state(result)
+    if state is None and result.get("status") in _GAME_STATUSES:
+        state = normalize_state(result)
     try:
-        state = client.get_state()
+        if state is None:
+            state = client.get_state()
         _update_session_from_state(state, session)
 
         status = state.get("status")
         if status == "completed" or (status == "waiting" and state.get("winner_id")):
+            if not display._all_characters(state) and not state.get("characters"):
+                state = client.get_state()  # need the roster for the summary
             _print_game_result(state, client, session)
     except TendrilsAPIError:
         pass
@@ -353,21 +478,18 @@ def _check_game_over(client: TendrilsClient, session: GameSession):
 def _print_game_result(state: dict, client: TendrilsClient, session: GameSession):
     """Print the winner and final summary."""
     session.game_status = "completed"
-    characters = _all_characters(state) or state.get("characters", [])
-    round_num = state.get("round_number", state.get("round", 0))
+    characters = display._all_characters(state) or state.get("characters", [])
+    round_num = state.get("round_number", 0)
     winner_id = state.get("winner_id")
 
     # Find winner by winner_id or by who's alive
     winner = None
     if winner_id:
-        for c in characters:
-            cid = c.get("id") or c.get("character_id")
-            if cid == winner_id:
-                winner = c
-                break
+        by_id = {c.get("id") or c.get("character_id"): c for c in characters}
+        winner = by_id.get(winner_id)
 
     if not winner:
-        alive = [c for c in characters if c.get("current_hp", c.get("hp", 0)) > 0]
+        alive = [c for c in characters if _extract(c)[2] > 0]
         if alive:
             winner = alive[0]
 
@@ -387,11 +509,17 @@ def _print_game_result(state: dict, client: TendrilsClient, session: GameSession
 def _auto_play_loop(
     client: TendrilsClient,
     session: GameSession,
-    delay: float = 0.3,
+    display_delay: float = 0.3,
 ):
-    """Simple AI loop: move toward nearest enemy, attack if adjacent."""
+    """Simple AI loop: move toward nearest enemy, attack if adjacent.
+
+    display_delay paces output between our own actions; while waiting for
+    our turn the loop polls with exponential backoff instead.
+    """
+    wait = _POLL_MIN
     last_round = 0
     max_iterations = 200  # safety limit
+    batch_supported = True  # cleared the first time the server rejects a batch
 
     for _ in range(max_iterations):
         try:
@@ -404,7 +532,8 @@ def _auto_play_loop(
                     return
             except TendrilsAPIError:
                 pass
-            time.sleep(delay)
+            time.sleep(wait)
+            wait = min(wait * 2, _POLL_MAX)
             continue
 
         _update_session_from_state(state, session)
@@ -415,46 +544,44 @@ def _auto_play_loop(
             return
 
         if not state.get("is_your_turn"):
-            time.sleep(delay)
+            time.sleep(wait)
+            wait = min(wait * 2, _POLL_MAX)
             continue
 
+        wait = _POLL_MIN
+
         # Round header + status summary
-        round_num = state.get("round_number", state.get("round", 0))
+        round_num = state.get("round_number", 0)
         if isinstance(round_num, int) and round_num > last_round:
             last_round = round_num
             display.print_round_header(round_num)
             display.print_state(state)
 
-        # Get all characters
-        characters = _all_characters(state)
+        # Index all characters by id
+        by_id = {c.get("id"): c for c in display._all_characters(state)}
 
         # Find my character and enemies
         me = state.get("your_character")
         my_id = me.get("id") if me else None
-        enemies = []
-        for c in characters:
-            cid = c.get("id")
-            if cid != my_id and c.get("current_hp", c.get("hp", 0)) > 0:
-                enemies.append(c)
+        enemies = [t for t in map(_extract, by_id.values()) if t[0] != my_id and t[2] > 0]
 
         if not me or not enemies:
             _auto_end_turn(client)
-            time.sleep(delay)
+            time.sleep(display_delay)
             continue
 
         my_pos = me.get("position", [0, 0])
         my_name = me.get("name", "?")
 
         # Find nearest enemy
-        nearest = min(enemies, key=lambda e: _dist(my_pos, e.get("position", [0, 0])))
-        enemy_pos = nearest.get("position", [0, 0])
-        enemy_id = nearest.get("id")
-        dist = _dist(my_pos, enemy_pos)
+        enemy_id, enemy_pos, _ = min(enemies, key=lambda t: _dist2(my_pos, t[1]))
+        enemy_name = by_id[enemy_id].get("name", "?")
+        dist2 = _dist2(my_pos, enemy_pos)
 
         # Simple AI: if adjacent (distance <= ~1.5 grid), attack. Otherwise move closer.
-        if dist <= 1.5:
+        if dist2 <= _ADJACENT_DIST2:
             # Attack
-            display.console.print(f"  [{my_name}] Attacks {nearest.get('name', '?')}!")
+            display.console.print(f"  [{my_name}] Attacks {enemy_name}!")
             try:
                 result = client.submit_action({
                     "action_type": "attack",
@@ -465,7 +592,7 @@ def _auto_play_loop(
                 display.print_error(e.message)
 
             # End turn after attacking
-            time.sleep(delay)
+            time.sleep(display_delay)
             _auto_end_turn(client)
         else:
             # Move toward enemy
@@ -474,6 +601,31 @@ def _auto_play_loop(
             target = _move_toward(my_pos, enemy_pos, max_squares)
 
             display.console.print(f"  [{my_name}] Moves to ({target[0]}, {target[1]})")
+
+            # Send move (+ attack if it lands adjacent) + end_turn as one batch
+            if batch_supported:
+                actions = [{"action_type": "move", "target_position": target}]
+                if _dist2(target, enemy_pos) <= _ADJACENT_DIST2:
+                    actions.append({"action_type": "attack", "target_id": enemy_id})
+                actions.append({"action_type": "end_turn"})
+                try:
+                    results = client.submit_actions_batch(actions)
+                except TendrilsAPIError as e:
+                    if e.status_code not in _BATCH_UNSUPPORTED:
+                        display.print_error(e.message)
+                        _auto_end_turn(client)
+                        time.sleep(display_delay)
+                        continue
+                    batch_supported = False
+                else:
+                    for action, action_result in zip(actions, results):
+                        if action["action_type"] == "attack":
+                            display.console.print(f"  [{my_name}] Attacks {enemy_name}!")
+                        if action["action_type"] != "end_turn":
+                            display.print_action_result(action_result)
+                    time.sleep(display_delay)
+                    continue
+
             try:
                 result = client.submit_action({
                     "action_type": "move",
@@ -483,33 +635,31 @@ def _auto_play_loop(
             except TendrilsAPIError as e:
                 display.print_error(e.message)
                 _auto_end_turn(client)
-                time.sleep(delay)
+                time.sleep(display_delay)
                 continue
 
-            time.sleep(delay)
+            time.sleep(display_delay)
 
-            # After moving, check if now adjacent and can attack
-            try:
-                state2 = client.get_state()
-            except TendrilsAPIError:
-                _auto_end_turn(client)
-                time.sleep(delay)
-                continue
+            # After moving, check if now adjacent and can attack. Use the
+            # state embedded in the move response when the server sends one.
+            state2 = _embedded_state(result)
+            if state2 is None:
+                try:
+                    state2 = client.get_state()
+                except TendrilsAPIError:
+                    _auto_end_turn(client)
+                    time.sleep(display_delay)
+                    continue
 
             me2 = state2.get("your_character")
             if me2:
                 new_pos = me2.get("position", target)
                 # Recalculate enemy position from updated state
-                chars2 = _all_characters(state2)
-                enemy2 = None
-                for c in chars2:
-                    if c.get("id") == enemy_id:
-                        enemy2 = c
-                        break
+                enemy2 = next((c for c in display._all_characters(state2) if c.get("id") == enemy_id), None)
                 ep = enemy2.get("position", enemy_pos) if enemy2 else enemy_pos
-                new_dist = _dist(new_pos, ep)
-                if new_dist <= 1.5 and state2.get("is_your_turn"):
-                    display.console.print(f"  [{my_name}] Attacks {nearest.get('name', '?')}!")
+                new_dist2 = _dist2(new_pos, ep)
+                if new_dist2 <= _ADJACENT_DIST2 and state2.get("is_your_turn"):
+                    display.console.print(f"  [{my_name}] Attacks {enemy_name}!")
                     try:
                         attack_result = client.submit_action({
                             "action_type": "attack",
@@ -521,7 +671,7 @@ def _auto_play_loop(
 
             _auto_end_turn(client)
 
-        time.sleep(delay)
+        time.sleep(display_delay)
 
 
 def _auto_end_turn(client: TendrilsClient):
@@ -532,13 +682,18 @@ def _auto_end_turn(client: TendrilsClient):
         pass
 
 
-def _dist(a: list, b: list) -> float:
-    """Euclidean distance between two grid positions."""
+def _extract(c: dict) -> tuple:
+    """Read a character's (id, position, hp) once."""
+    return c.get("id"), c.get("position") or [0, 0], c.get("current_hp", c.get("hp", 0))
+
+
+def _dist2(a: list, b: list) -> float:
+    """Squared Euclidean distance between two grid positions (no sqrt needed to compare)."""
     ax = a[0] if isinstance(a, (list, tuple)) and len(a) >= 2 else 0
     ay = a[1] if isinstance(a, (list, tuple)) and len(a) >= 2 else 0
     bx = b[0] if isinstance(b, (list, tuple)) and len(b) >= 2 else 0
     by = b[1] if isinstance(b, (list, tuple)) and len(b) >= 2 else 0
-    return math.sqrt((ax - bx) ** 2 + (ay - by) ** 2)
+    return (ax - bx) ** 2 + (ay - by) ** 2
 
 
 def _move_toward(my_pos: list, target_pos: list, max_squares: int) -> list[int]:
@@ -548,7 +703,9 @@ def _move_toward(my_pos: list, target_pos: list, max_squares: int) -> list[int]:
 
     dx = tx - mx
     dy = ty - my
-    dist = math.sqrt(dx ** 2 + dy ** 2)
+    if dx == 0 and dy == 0:
+        return [mx, my]
+    dist = math.hypot(dx, dy)
 
     if dist <= max_squares:
         # Move adjacent to target (1 square away)
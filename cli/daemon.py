@@ -0,0 +1,91 @@
+"""Long-lived daemon that serves game commands over a unix socket.
+
+Keeps one TendrilsClient and GameSession alive so repeated commands skip
+interpreter startup, imports and connection setup.
+"""
+
+import io
+import os
+import socket
+import socketserver
+import sys
+import threading
+from pathlib import Path
+
+from cli import display
+from cli.client import TendrilsClient
+from cli.commands import handle_command
+from cli.game_session import GameSession
+
+SOCKET_PATH = Path.home() / ".cache" / "tendrils" / "daemon.sock"
+
+client: TendrilsClient | None = None
+session: GameSession | None = None
+
+# Commands share one client/session and the display console, so run them one at a time.
+_lock = threading.Lock()
+
+
+class _CommandHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        cmd = self.rfile.readline().decode("utf-8").strip()
+        out = io.TextIOWrapper(self.wfile, encoding="utf-8", write_through=True)
+        with _lock:
+            saved = display.console.file
+            display.console.file = out
+            try:
+                if cmd.lower().split()[:2] == ["join", "custom"]:
+                    # The builder reads the daemon's own stdin, not this connection
+                    display.print_error(
+                        "'join custom' isn't available through the daemon. "
+                        "Use 'join <preset>', or run it without --daemon."
+                    )
+                    keep_running = True
+                else:
+                    keep_running = handle_command(cmd, client, session)
+            except Exception as e:
+                display.print_error(str(e))
+                keep_running = True
+            finally:
+                display.console.file = saved
+        out.detach()
+        if not keep_running:
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+
+
+def serve(server_url: str, token: str, socket_path: Path = SOCKET_PATH):
+    """Run the daemon in the foreground until 'quit' is received."""
+    global client, session
+
+    client = TendrilsClient(server_url, token)
+    session = GameSession()
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    socket_path.unlink(missing_ok=True)
+
+    try:
+        with socketserver.UnixStreamServer(str(socket_path), _CommandHandler) as server:
+            os.chmod(socket_path, 0o600)
+            display.console.print(f"Daemon listening on {socket_path}")
+            server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        socket_path.unlink(missing_ok=True)
+        client.close()
+
+
+def send(cmd: str, socket_path: Path = SOCKET_PATH) -> int:
+    """Send one command to a running daemon and stream its output to stdout."""
+    try:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(str(socket_path))
+    except OSError:
+        print(f"Error: no daemon listening on {socket_path}. Start one with --daemon.", file=sys.stderr)
+        return 1
+
+    with sock:
+        sock.sendall(cmd.encode("utf-8") + b"\n")
+        while chunk := sock.recv(65536):
+            sys.stdout.buffer.write(chunk)
+            sys.stdout.buffer.flush()
+    return 0
@@ -1,24 +1,40 @@
 """Output formatting and rendering using rich."""
 
-from rich.console import Console
+import sys
+from functools import cache, lru_cache
+
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
 console = Console()
 
+_BAR_WIDTH = 25
+_HP_COLORS = ("red", "yellow", "green")
+
 
 def _all_characters(state: dict) -> list[dict]:
-    """Combine your_character + visible_characters into one list."""
+    """Combine your_character + visible_characters into one list.
+
+    The result is cached on the state dict, so rendering the same state
+    more than once walks the roster only once. Treat it as read-only.
+    """
+    chars = state.get("__all_chars")
+    if chars is not None:
+        return chars
+
     chars = []
     mine = state.get("your_character")
+    mine_id = mine.get("id") if mine else None
     if mine:
         chars.append(mine)
     for c in state.get("visible_characters", []):
         # Avoid duplicates
-        if mine and c.get("id") == mine.get("id"):
+        if mine and c.get("id") == mine_id:
             continue
         chars.append(c)
+    state["__all_chars"] = chars
     return chars
 
 
@@ -34,7 +50,7 @@ def print_banner(server_info: dict):
 
 def print_state(state: dict):
     """Show current turn info, character positions, HP bars."""
-    round_num = state.get("round_number", state.get("round", "?"))
+    round_num = state.get("round_number", "?")
     is_my_turn = state.get("is_your_turn", False)
     mine = state.get("your_character", {})
     my_name = mine.get("name", "?") if mine else "?"
@@ -50,12 +66,11 @@ def print_state(state: dict):
         return
 
     my_id = mine.get("id") if mine else None
-    for char in characters:
-        _print_hp_bar(char, is_you=(char.get("id") == my_id))
-    console.print()
+    lines = [_hp_bar_line(char, is_you=(char.get("id") == my_id)) for char in characters]
+    console.print("\n".join(lines) + "\n")
 
 
-def _print_hp_bar(char: dict, is_you: bool = False):
+def _hp_bar_line(char: dict, is_you: bool = False) -> str:
     name = char.get("name", "?")
     if is_you:
         name += " (you)"
@@ -64,66 +79,81 @@ def _print_hp_bar(char: dict, is_you: bool = False):
     pos = char.get("position", [0, 0])
 
     if max_hp > 0:
-        ratio = hp / max_hp
-    else:
-        ratio = 0
-    bar_width = 25
-    filled = int(ratio * bar_width)
-    empty = bar_width - filled
-
-    if ratio > 0.5:
-        color = "green"
-    elif ratio > 0.25:
-        color = "yellow"
+        filled = max(0, min(_BAR_WIDTH, hp * _BAR_WIDTH // max_hp))
+        # Integer compare per threshold: > 1/4 and > 1/2 of max HP
+        color = _HP_COLORS[(4 * hp > max_hp) + (2 * hp > max_hp)]
     else:
-        color = "red"
+        filled, color = 0, "red"
 
-    bar = f"[{color}]{'█' * filled}[/{color}][dim]{'░' * empty}[/dim]"
+    bar = _bar(filled, color)
     pos_str = f"({pos[0]}, {pos[1]})" if isinstance(pos, (list, tuple)) and len(pos) >= 2 else str(pos)
-    console.print(f"  {name:<22} {bar}  {hp}/{max_hp} HP  {pos_str}")
+    return f"  {name:<22} {bar}  {hp}/{max_hp} HP  {pos_str}"
+
+
+@lru_cache(maxsize=128)
+def _bar(filled: int, color: str) -> str:
+    """Markup for an HP bar; only _BAR_WIDTH + 1 fill levels x 3 colours exist."""
+    return f"[{color}]{'█' * filled}[/{color}][dim]{'░' * (_BAR_WIDTH - filled)}[/dim]"
 
 
 def print_action_result(result: dict):
     """Color-coded combat results."""
-    action_type = result.get("action_type", "")
-    desc = result.get("description", "")
-    success = result.get("success", True)
-
-    if not success:
-        error = result.get("error", desc)
+    if not result.get("success", True):
+        error = result.get("error", result.get("description", ""))
         console.print(f"  [red]Failed:[/red] {error}")
         return
 
-    if action_type == "attack":
-        roll = result.get("attack_roll")
-        hit = result.get("hit", False)
-        damage = result.get("damage_dealt")
-        target_hp = result.get("target_hp_remaining")
-
-        console.print(f"  {desc}")
-        if roll is not None:
-            if hit:
-                console.print(f"  [green]HIT![/green] {damage} damage dealt", end="")
-                if target_hp is not None:
-                    if target_hp <= 0:
-                        console.print(f" — [bold red]TARGET SLAIN![/bold red]")
-                    else:
-                        console.print(f" — Target: {target_hp} HP remaining")
+    _RESULT_HANDLERS.get(result.get("action_type", ""), _print_other_result)(result)
+
+
+def _print_attack_result(result: dict):
+    desc = result.get("description", "")
+    roll = result.get("attack_roll")
+    hit = result.get("hit", False)
+    damage = result.get("damage_dealt")
+    target_hp = result.get("target_hp_remaining")
+
+    # Description and outcome go out as one Text in a single print
+    text = Text(f"  {desc}")
+    if roll is not None:
+        if hit:
+            text.append("\n  ").append("HIT!", "green").append(f" {damage} damage dealt")
+            if target_hp is not None:
+                if target_hp <= 0:
+                    text.append(" — ").append("TARGET SLAIN!", "bold red")
                 else:
-                    console.print()
-            else:
-                console.print(f"  [red]MISS![/red]")
-    elif action_type in ("move", "dash"):
-        path = result.get("movement_path", [])
-        if path:
-            dest = path[-1]
-            console.print(f"  [cyan]Moved to ({dest[0]}, {dest[1]})[/cyan]")
+                    text.append(f" — Target: {target_hp} HP remaining")
         else:
-            console.print(f"  [cyan]{desc}[/cyan]")
-    elif action_type == "end_turn":
-        console.print(f"  [dim]{desc}[/dim]")
+            text.append("\n  ").append("MISS!", "red")
+    console.print(text)
+
+
+def _print_move_result(result: dict):
+    path = result.get("movement_path", [])
+    if path:
+        dest = path[-1]
+        console.print(f"  [cyan]Moved to ({dest[0]}, {dest[1]})[/cyan]")
     else:
-        console.print(f"  [yellow]{desc}[/yellow]")
+        console.print(f"  [cyan]{result.get('description', '')}[/cyan]")
+
+
+def _print_end_turn_result(result: dict):
+    console.print(f"  [dim]{result.get('description', '')}[/dim]")
+
+
+def _print_other_result(result: dict):
+    console.print(f"  [yellow]{result.get('description', '')}[/yellow]")
+
+
+_RESULT_HANDLERS = {
+    "attack": _print_attack_result,
+    "move": _print_move_result,
+    "dash": _print_move_result,
+    "end_turn": _print_end_turn_result,
+}
+
+
+_LOG_STYLE = {"attack_hit": "green", "attack_miss": "red", "move": "cyan", "dash": "cyan"}
 
 
 def print_log(events: list):
@@ -132,19 +162,21 @@ def print_log(events: list):
         console.print("[dim]No events yet.[/dim]")
         return
 
-    for event in events:
-        round_num = event.get("round_number", event.get("round", "?"))
-        desc = event.get("description", event.get("message", str(event)))
-        action_type = event.get("action_type", "")
+    console.print(Group(*map(_log_line, events)))
 
-        if action_type == "attack":
-            style = "green" if event.get("hit") else "red"
-        elif action_type in ("move", "dash"):
-            style = "cyan"
-        else:
-            style = "white"
 
-        console.print(f"  [dim]R{round_num}[/dim] [{style}]{desc}[/{style}]")
+def print_log_event(event: dict):
+    """Print a single battle log line."""
+    console.print(_log_line(event))
+
+
+def _log_line(event: dict) -> Text:
+    round_num = event.get("round_number", event.get("round", "?"))
+    desc = event.get("description", event.get("message", str(event)))
+    action_type = event.get("action_type", "")
+    if action_type == "attack":
+        action_type = "attack_hit" if event.get("hit") else "attack_miss"
+    return Text.assemble("  ", (f"R{round_num}", "dim"), " ", (str(desc), _LOG_STYLE.get(action_type, "white")))
 
 
 def print_map(state: dict):
@@ -158,60 +190,89 @@ def print_map(state: dict):
     my_id = mine.get("id") if mine else None
 
     positions = {}
+    used = set()
     legend = []
+    lo_x = lo_y = hi_x = hi_y = None  # bounding box, tracked while placing
     for char in characters:
         pos = char.get("position", [0, 0])
         if isinstance(pos, (list, tuple)) and len(pos) >= 2:
             x, y = int(pos[0]), int(pos[1])
         else:
             continue
+        if lo_x is None:
+            lo_x = hi_x = x
+            lo_y = hi_y = y
+        else:
+            if x < lo_x:
+                lo_x = x
+            elif x > hi_x:
+                hi_x = x
+            if y < lo_y:
+                lo_y = y
+            elif y > hi_y:
+                hi_y = y
         name = char.get("name", "?")
         hp = char.get("current_hp", char.get("hp", 0))
         max_hp = char.get("max_hp", hp)
         label = name[0].upper()
         # Avoid duplicate labels
-        used = {v for v in positions.values()}
         if label in used:
-            for c in name.upper():
-                if c not in used and c != " ":
-                    label = c
-                    break
+            label = next((c for c in name.upper() if c not in used and c != " "), label)
+        used.add(label)
         positions[(x, y)] = label
         legend.append((label, name, hp, max_hp, char.get("id") == my_id))
 
-    # Calculate bounds with padding
-    xs = [p[0] for p in positions]
-    ys = [p[1] for p in positions]
+    if lo_x is None:
+        console.print("[dim]No characters to display.[/dim]")
+        return
+
+    # Pad the bounding box and clamp it to the board
     pad = 3
-    min_x = max(0, min(xs) - pad)
-    max_x = min(19, max(xs) + pad)
-    min_y = max(0, min(ys) - pad)
-    max_y = min(19, max(ys) + pad)
+    min_x = max(0, lo_x - pad)
+    max_x = min(19, hi_x + pad)
+    min_y = max(0, lo_y - pad)
+    max_y = min(19, hi_y + pad)
 
     # Header row
-    header = "    " + "".join(f"{x:>4}" for x in range(min_x, max_x + 1))
-    console.print(header)
-
-    # Grid rows
+    rows = [_map_header(min_x, max_x)]
+
+    # Grid rows: copy an empty row and splice in the labels that fall on it
+    labels_by_row = {}
+    for (x, y), label in positions.items():
+        if min_x <= x <= max_x:
+            labels_by_row.setdefault(y, []).append((x - min_x, label))
+    empty_row = [" .  "] * (max_x - min_x + 1)
     for y in range(min_y, max_y + 1):
-        row = f"{y:>3} "
-        for x in range(min_x, max_x + 1):
-            if (x, y) in positions:
-                row += f" [bold yellow]{positions[(x, y)]}[/bold yellow]  "
-            else:
-                row += " .  "
-        console.print(row)
+        cells = empty_row.copy()
+        for i, label in labels_by_row.get(y, ()):
+            cells[i] = f" [bold yellow]{label}[/bold yellow]  "
+        rows.append(f"{y:>3} " + "".join(cells))
+    # Emit the whole grid in one write; highlighting only recolours the axis numbers
+    console.print("\n".join(rows), highlight=False)
 
     # Legend
-    console.print()
+    lines = [""]
     for label, name, hp, max_hp, is_you in legend:
         you_tag = " [bold cyan](you)[/bold cyan]" if is_you else ""
-        console.print(f"  [bold yellow]{label}[/bold yellow] = {name} ({hp}/{max_hp} HP){you_tag}")
-    console.print()
+        lines.append(f"  [bold yellow]{label}[/bold yellow] = {name} ({hp}/{max_hp} HP){you_tag}")
+    console.print("\n".join(lines) + "\n")
+
+
+@lru_cache(maxsize=64)
+def _map_header(min_x: int, max_x: int) -> str:
+    """Column-number header row for a map window."""
+    return "    " + "".join(f"{x:>4}" for x in range(min_x, max_x + 1))
 
 
 def print_help():
     """Command reference."""
+    console.print(_help_table())
+    console.print()
+
+
+@cache
+def _help_table() -> Table:
+    """Build the static help table once; later calls reuse it."""
     table = Table(title="Commands", show_header=True, header_style="bold cyan", show_lines=False, pad_edge=False)
     table.add_column("Command", style="bold white", min_width=24)
     table.add_column("Action", style="white")
@@ -243,9 +304,7 @@ def print_help():
 
     table.add_row("[bold]Utility[/bold]", "")
     table.add_row("auto", "Auto-play current character")
-
-    console.print(table)
-    console.print()
+    return table
 
 
 def print_error(msg: str):
@@ -260,8 +319,12 @@ def print_info(msg: str):
     console.print(f"[cyan]{msg}[/cyan]")
 
 
+_ROUND_HEADER_OPEN = f"\n[bold]{'═' * 6} Round "
+_ROUND_HEADER_CLOSE = f" {'═' * 6}[/bold]\n"
+
+
 def print_round_header(round_num: int):
-    console.print(f"\n[bold]{'═' * 6} Round {round_num} {'═' * 6}[/bold]\n")
+    console.print(f"{_ROUND_HEADER_OPEN}{round_num}{_ROUND_HEADER_CLOSE}")
 
 
 def print_winner(name: str, hp: int, max_hp: int, rounds: int):
@@ -272,10 +335,32 @@ def print_winner(name: str, hp: int, max_hp: int, rounds: int):
     console.print(Panel(text, style="bold yellow", width=44))
 
 
+_prompt_session = None
+
+
+def _read_line(text: str) -> str:
+    """Read one line, with history and line editing when on a terminal.
+
+    Uses a single persistent prompt_toolkit PromptSession if it is installed
+    and we're interactive; otherwise (piped input, daemon) plain input().
+    """
+    global _prompt_session
+    if _prompt_session is None and sys.stdin.isatty() and sys.stdout.isatty():
+        try:
+            from prompt_toolkit import PromptSession
+        except ImportError:
+            _prompt_session = False
+        else:
+            _prompt_session = PromptSession()
+    if _prompt_session:
+        return _prompt_session.prompt(text)
+    return input(text)
+
+
 def prompt(session) -> str:
     """Context-aware input prompt."""
     try:
-        return input("tendrils> ").strip()
+        return _read_line("tendrils> ").strip()
     except EOFError:
         return "quit"
 
@@ -288,6 +373,6 @@ def combat_prompt(round_num, turn_name: str, is_my_turn: bool) -> str:
         prefix = f"[R{round_num} -- {turn_name}'s turn (waiting)]"
 
     try:
-        return input(f"{prefix}> ").strip()
+        return _read_line(f"{prefix}> ").strip()
     except EOFError:
         return "quit"
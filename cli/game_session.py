@@ -1,7 +1,9 @@
 """Session state tracking for the current game."""
 
+import time
+from types import MappingProxyType
 
-PRESETS = {
+_PRESET_DATA = {
     "fighter": {
         "name": "Gronk the Fighter",
         "ability_scores": {
@@ -101,12 +103,33 @@ PRESETS = {
 }
 
 
+def _freeze(preset: dict) -> MappingProxyType:
+    return MappingProxyType({
+        **preset,
+        "ability_scores": MappingProxyType(preset["ability_scores"]),
+        "attacks": tuple(MappingProxyType(a) for a in preset["attacks"]),
+    })
+
+
+# Read-only templates; use instantiate() to get a payload you can modify or send.
+PRESETS = MappingProxyType({name: _freeze(preset) for name, preset in _PRESET_DATA.items()})
+
+
+def instantiate(name: str) -> dict:
+    """Build a fresh, mutable character payload from a preset."""
+    p = PRESETS[name]
+    return {**p, "ability_scores": dict(p["ability_scores"]), "attacks": [dict(a) for a in p["attacks"]]}
+
+
 class GameSession:
     def __init__(self):
         self.character_id: str | None = None
         self.character_name: str | None = None
         self.has_character: bool = False
         self.game_status: str | None = None  # waiting, active, completed
+        # Last full state seen, reused by the prompt until it goes stale
+        self.last_state: dict | None = None
+        self.last_state_at: float = 0.0
 
     def set_character(self, character_id: str, name: str):
         self.character_id = character_id
@@ -118,3 +141,19 @@ class GameSession:
         self.character_name = None
         self.has_character = False
         self.game_status = None
+        self.invalidate_state()
+
+    def cache_state(self, state: dict):
+        self.last_state = state
+        self.last_state_at = time.monotonic()
+
+    def cached_state(self, max_age: float | None) -> dict | None:
+        """Return the cached state if it is younger than max_age seconds (None: any age)."""
+        if self.last_state is None:
+            return None
+        if max_age is not None and time.monotonic() - self.last_state_at > max_age:
+            return None
+        return self.last_state
+
+    def invalidate_state(self):
+        self.last_state = None
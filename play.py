@@ -11,6 +11,11 @@ from cli import display
 
 DEFAULT_SERVER = "https://web-production-969c8.up.railway.app"
 
+# How long the prompt may reuse the last polled state before refetching (seconds)
+STATE_MAX_AGE = 2.0
+# Same, while the server is pushing state; bounds how long a stalled stream can go unnoticed
+LIVE_STATE_MAX_AGE = 30.0
+
 
 def game_main(args):
     """Run the interactive game client."""
@@ -34,20 +39,27 @@ def game_main(args):
     display.console.print(f"\nConnected to {args.server}")
     display.console.print("Type 'help' for commands.\n")
 
+    # Let the server push state changes when it supports it; otherwise poll
+    live = client.subscribe_state(session.cache_state)
+
     # Main loop
     try:
         while True:
             # Context-aware prompt
             if session.game_status == "active" and session.has_character:
                 try:
-                    state = client.get_state()
+                    max_age = LIVE_STATE_MAX_AGE if live.is_set() else STATE_MAX_AGE
+                    state = session.cached_state(max_age)
+                    if state is None:
+                        state = client.get_state()
+                        session.cache_state(state)
 
                     status = state.get("status", "")
                     if status == "completed" or (status == "waiting" and state.get("winner_id")):
                         session.game_status = "completed"
                         cmd = display.prompt(session)
                     else:
-                        round_num = state.get("round_number", state.get("round", 0))
+                        round_num = state.get("round_number", 0)
                         is_my_turn = state.get("is_your_turn", False)
                         mine = state.get("your_character", {})
                         my_name = mine.get("name", "?") if mine else "?"
@@ -79,6 +91,17 @@ def main():
         default=None,
         help="API key for authentication (e.g. sk_...)",
     )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Run as a background daemon serving game commands over a unix socket",
+    )
+    parser.add_argument(
+        "--connect-daemon",
+        default=None,
+        metavar="COMMAND",
+        help="Send one command to a running daemon and print its output",
+    )
     parser.add_argument(
         "--admin",
         action="store_true",
@@ -89,6 +112,12 @@ def main():
         default=None,
         help="Admin secret for admin mode",
     )
+    parser.add_argument(
+        "--admin-script",
+        default=None,
+        metavar="FILE",
+        help="Run admin actions from a JSON/NDJSON file ('-' for stdin) instead of the menu",
+    )
     args = parser.parse_args()
 
     if args.admin:
@@ -104,7 +133,19 @@ def main():
                 print("Error: admin secret is required.", file=sys.stderr)
                 sys.exit(1)
 
-        admin_main(args.server, secret)
+        admin_main(args.server, secret, args.admin_script)
+    elif args.connect_daemon is not None:
+        from cli.daemon import send
+
+        sys.exit(send(args.connect_daemon))
+    elif args.daemon:
+        if not args.token:
+            print("Error: --token is required for daemon mode.", file=sys.stderr)
+            sys.exit(1)
+
+        from cli.daemon import serve
+
+        serve(args.server, args.token)
     else:
         game_main(args)
 